@@ -1,20 +1,42 @@
-__all__ = ["Board", "Square", "makeStandardBoard"]
+__all__ = ["Board", "Square", "makeStandardBoard", "LIGHT", "DARK"]
 
 
 import numpy as np  # We'll use a numpy array for the board.
+from functools import lru_cache
 from typing import Union, List, Tuple
 
 from chess_pieces import Piece, King, Queen, Rook, Bishop, Knight, Pawn
+from chess_pieces import PIECE_QUEEN, PIECE_ROOK, PIECE_KNIGHT, PIECE_BISHOP
+from chess_pieces import PIECE_KING
 
 
 FILE = 'abcdefgh'  # Letters are used to denote files.
 RANK = '87654321'  # Numbers are used to denote ranks.
 
+LIGHT = 'light'  # Square colors.  Compare these by identity.
+DARK = 'dark'
+# Bit file*8 + rank is set for each light square.
+_LIGHT_MASK = 0xAA55AA55AA55AA55
+# Single-bit masks for each square, indexed by file*8 + rank.
+SQUARE_BITS = tuple(np.uint64(1) << np.uint64(sq) for sq in range(64))
+_SQUARE_BIT_ARRAY = np.array(SQUARE_BITS, dtype=np.uint64)
+# Zobrist keys for each bitboard index and square.  XORing together the
+# keys of every piece on the board gives the position's hash.
+ZOBRIST = np.random.default_rng(0).integers(
+    0, 2**64, size=(12, 64), dtype=np.uint64)
+# File and rank of each square, indexed by file*8 + rank.
+_SQ_FILES = np.arange(64, dtype=np.uint8) >> 3
+_SQ_RANKS = np.arange(64, dtype=np.uint8) & 7
+# Color of each square, read from the light-square mask.
+_SQ_COLORS = tuple(
+    LIGHT if (_LIGHT_MASK >> sq) & 1 else DARK for sq in range(64))
+
 
 def defineFILEandRANK(files: int, ranks: int) -> Tuple[List[str]]:
     """
-    Creates FILE and RANK globals for converting between computer and
-    algebraic notations.  Only run for board sizes other than 8 x 8.
+    Creates the FILE and RANK sequences a Board uses for converting
+    between computer and algebraic notations.  Only run for board sizes
+    other than 8 x 8; otherwise the module-level FILE and RANK are used.
     Placed in here for potential compatability for odd chess variants
     and puzzles.
     """
@@ -27,8 +49,24 @@ def defineFILEandRANK(files: int, ranks: int) -> Tuple[List[str]]:
         rankList.append(str(rank))
     
     return fileList, rankList
-    
 
+
+def _makeSquareNames(files, ranks) -> Tuple[str]:
+    """
+    Returns the algebraic name of every square, indexed by
+    file*8 + rank.  Ranks past the edge of a small board are left blank.
+    """
+    return tuple(
+        files[file] + ranks[rank] if rank < len(ranks) else ''
+        for file in range(len(files))
+        for rank in range(8)
+    )
+
+
+_SQ_NAMES = _makeSquareNames(FILE, RANK)
+
+
+@lru_cache(maxsize=64)
 def algebraicToComputer(coordinate: str) -> Tuple[int]:
     """
     Takes algebraic notation for a square and converts it to a tuple
@@ -36,6 +74,9 @@ def algebraicToComputer(coordinate: str) -> Tuple[int]:
     
         algebraicToComputer("a8") == (0, 0)
     
+    Only handles the standard 8 x 8 board; other sizes name their
+    squares from Board.FILE and Board.RANK.
+    
     For the inverse function, see computerToAlgebraic().
     """
     file = FILE.index(coordinate[0])
@@ -49,24 +90,96 @@ def computerToAlgebraic(file: int, rank: int) -> str:
     Takes the computer's coordinates for a square and converts it into
     a string in algebraic notation.  For example,
     
-        computerToAlgebraic((0, 1)) == 'a2'
+        computerToAlgebraic(0, 1) == 'a7'
+    
+    Only handles the standard 8 x 8 board; other sizes name their
+    squares from Board.FILE and Board.RANK.  Raises IndexError if the
+    file or rank is off the board.
     
     For the inverse function, see algebraicToComputer().
     """
-    file = FILE[file]
-    rank = RANK[rank]
+    if not (0 <= file < 8 and 0 <= rank < 8):
+        raise IndexError(f'Square ({file}, {rank}) is off the board.')
+    
+    return _SQ_NAMES[file*8 + rank]
     
-    return file + rank
+
+def _makeLineAttacks(x: int, y: int) -> Tuple[tuple, dict]:
+    """
+    Precomputes sliding attacks along the line through each square in
+    the (x, y) direction and its opposite.
+    
+    Returns a tuple of masks and a dictionary of attacks.  masks[sq]
+    holds the squares on the line that can block a slider standing on
+    sq (the edge squares never block anything, so they are left out).
+    The attacks are keyed by (sq, occ & masks[sq]), so a slider's moves
+    along a line are a single dictionary lookup.
+    """
+    masks = []
+    attacks = {}
+    for sq in range(64):
+        file, rank = sq >> 3, sq & 7
+        rays = []
+        for dx, dy in ((x, y), (-x, -y)):
+            ray = []
+            f, r = file + dx, rank + dy
+            while 0 <= f < 8 and 0 <= r < 8:
+                ray.append(1 << (f*8 + r))
+                f, r = f + dx, r + dy
+            rays.append(ray)
+        mask = 0
+        for ray in rays:
+            for bit in ray[:-1]:
+                mask |= bit
+        masks.append(mask)
+        # Walk through every subset of the mask (carry-rippler trick).
+        occ = 0
+        while True:
+            attack = 0
+            for ray in rays:
+                for bit in ray:
+                    attack |= bit
+                    if occ & bit:
+                        break
+            attacks[sq, occ] = attack
+            occ = (occ - mask) & mask
+            if not occ:
+                break
+    
+    return tuple(masks), attacks
+
+
+def _makeDirectionTable(lines: dict) -> dict:
+    """
+    Maps each direction a piece can move in to the (masks, attacks)
+    table of its line.  A direction and its opposite share the same
+    line.
+    """
+    table = {}
+    for (x, y), line in lines.items():
+        table[x, y] = table[-x, -y] = line
     
+    return table
+
+
+rank_masks, rank_attacks = _makeLineAttacks(1, 0)
+file_masks, file_attacks = _makeLineAttacks(0, 1)
+diag_masks_ne, diag_attacks_ne = _makeLineAttacks(1, -1)
+diag_masks_nw, diag_attacks_nw = _makeLineAttacks(1, 1)
+# Lookup tables for each direction a piece can move in.
+LINE_ATTACKS = _makeDirectionTable({
+    (1, 0): (rank_masks, rank_attacks),
+    (0, 1): (file_masks, file_attacks),
+    (1, -1): (diag_masks_ne, diag_attacks_ne),
+    (1, 1): (diag_masks_nw, diag_attacks_nw),
+})
+
 
 def getSquareColor(file: int, rank: int) -> str:
     """
     Returns the color of the square on the chess board.
     """
-    if (rank % 2 == file % 2):
-        return 'light'
-    else:
-        return 'dark'
+    return _SQ_COLORS[file*8 + rank]
     
 
 class Square():
@@ -75,48 +188,47 @@ class Square():
     
     The attributes that identify a square are its coordinates, i.e. its
     file and rank, so these are required when initiallizing a Square
-    object. Upon creation, the Square's file (column), rank (row),
-    color (light or dark square), and name (i.e. 'a1') are set.
+    object. Upon creation, the Square's index (file*8 + rank, packing
+    the file (column) and rank (row) into one int), color (light or
+    dark square), and name (i.e. 'a1') are set.
     The self.piece attribute is set to None to denote an empty Square.
     A piece can be set later with the Square.set_piece() method.
     """
+    __slots__ = ('sq', 'board', 'color', 'piece', 'name', 'selected')
+    
     def __init__(self, file: int, rank: int, board) -> None:
-        self.file = file
-        self.rank = rank
+        sq = file*8 + rank
+        self.sq = sq  # File is sq >> 3 and rank is sq & 7.
         self.board = board
-        self.color = getSquareColor(file, rank)
+        self.color = _SQ_COLORS[sq]
         self.piece = None
-        self.name = computerToAlgebraic(file, rank)
+        self.name = board.square_names[sq]
         self.selected = False
     
     def __eq__(self, other) -> bool:
         """Return self == other."""
-        if isinstance(other, Square):
-            if (self.board, self.file, self.rank) == (
-                    other.board, other.file, other.rank):
-                return True
-        
-        return False
+        return (type(other) is Square and self.sq == other.sq
+                and self.board is other.board)
         
     def __hash__(self) -> int:
         """Return hash(self)."""
-        return hash((self.board, self.file, self.rank))
+        return hash((id(self.board), self.sq))
     
     def __repr__(self) -> str:
         """Return repr(self)."""
         return (f"self.__class__.__name__("
-                f"{self.file}, {self.rank})")
+                f"{self.sq >> 3}, {self.sq & 7})")
     
     def __str__(self):
         return f"{self.name} square"        
     
     def get_file(self) -> int:
         """Returns the file of the square as an integer from 0 - 7."""
-        return self.file
+        return self.sq >> 3
     
     def get_rank(self) -> int:
         """Returns the rank of the square as an integer from 0 - 7."""
-        return self.rank
+        return self.sq & 7
     
     def get_coords(self) -> Tuple[int]:
         """
@@ -124,7 +236,8 @@ class Square():
         
             file, rank.
         """
-        return self.file, self.rank
+        sq = self.sq
+        return sq >> 3, sq & 7
     
     def get_color(self) -> str:
         """
@@ -148,14 +261,11 @@ class Square():
     
     def has_piece(self) -> bool:
         """Returns True if there is a piece on the square, else False."""
-        if self.piece is not None:
-            return True
-        
-        return False
+        return self.piece is not None
     
     def get_piece_name(self) -> str:
         """Returns a string stating which piece is on the square."""
-        if self.has_piece():
+        if self.piece is not None:
             return self.piece.get_name()
         else:
             return 'There is no piece on {}.'.format(self.get_name())
@@ -165,13 +275,35 @@ class Square():
         Sets a Piece object to the Square, and simultaneously
         sets the Square to the Piece object.
         """
+        if self.piece is not None:
+            self.remove_piece()
         self.piece = piece        
         piece.square = self
         
+        board = self.board
+        sq = self.sq
+        index = 6*piece.color_id + piece.type_id
+        bit = SQUARE_BITS[sq]
+        board.bb[index] |= bit
+        board.occ_by_color[piece.color_id] |= bit
+        board.occ |= bit
+        board.piece_idx[sq] = index
+        board.zobrist ^= ZOBRIST[index, sq]
+        
     def remove_piece(self) -> None:
         """Removes the piece from the square."""
-        if self.has_piece():
-            self.piece.square = None
+        piece = self.piece
+        if piece is not None:
+            board = self.board
+            sq = self.sq
+            index = 6*piece.color_id + piece.type_id
+            bit = ~SQUARE_BITS[sq]
+            board.bb[index] &= bit
+            board.occ_by_color[piece.color_id] &= bit
+            board.occ &= bit
+            board.piece_idx[sq] = -1
+            board.zobrist ^= ZOBRIST[index, sq]
+            piece.square = None
             self.piece = None
         
     def get_board(self):
@@ -183,22 +315,16 @@ class Square():
         Determines if the piece on the given square is the same color
         as the given piece.
         """
-        if self.has_piece():
-            if piece.get_color() == self.get_piece().get_color():
-                return True
-            
-        return False
+        p = self.piece
+        return p is not None and p.color == piece.color
     
     def has_enemy_piece(self, piece) -> bool:
         """
         Determines if the piece on the given square is the opposite
         color of the given piece.
         """
-        if self.has_piece():
-            if piece.get_color() != self.get_piece().get_color():
-                return True
-            
-        return False
+        p = self.piece
+        return p is not None and p.color != piece.color
     
     def is_selected(self) -> bool:
         """
@@ -213,44 +339,88 @@ class Board():
     Chess board object.
     
     Upon creation, makes a board of numFiles x numRanks Square objects
-    saved to a numpy array.  The coordinates of the array correspond to
-    the Square's coordinates.
+    saved to a flat list.  The Square at file, rank is found at index
+    file*8 + rank, or with Board.sq(file, rank).
+    
+    The position is also kept in twelve bitboards (one per piece type
+    and color) along with occupancy masks for each side and for the
+    whole board.  Bit file*8 + rank is set when a piece occupies that
+    square, so boards can be no larger than 8 x 8.
+    
+    The pieces are also mirrored in the piece_idx numpy array, indexed
+    by file*8 + rank, so scans over the board run in C instead of
+    through 64 Square objects.  piece_idx holds the bitboard index of
+    the piece on each square, or -1 for an empty square.
+    
+    Board.zobrist holds the Zobrist hash of the pieces on the board and
+    is updated along with the bitboards.  Use int(board.zobrist) as the
+    key for repetition checks and transposition tables; the Board itself
+    still hashes and compares by identity.
     """
+    __slots__ = (
+        'files', 'ranks', 'bb', 'occ_by_color', 'occ', 'mask',
+        'piece_idx', 'pieces', 'piece_lists', 'queens', 'rooks', 'knights',
+        'bishops', 'squares', 'white_king', 'black_king', 'zobrist', 'FILE',
+        'RANK', 'square_names',
+    )
+    
     def __init__(self, numFiles: int=8, numRanks: int=8) -> None:
+        if numFiles > 8 or numRanks > 8:
+            raise ValueError('The board can be no larger than 8 x 8.')
         if (numFiles != 8 or numRanks != 8):
-            global FILE, RANK
-            FILE, RANK = defineFILEandRANK(numFiles, numRanks)
+            self.FILE, self.RANK = defineFILEandRANK(numFiles, numRanks)
+            self.square_names = _makeSquareNames(self.FILE, self.RANK)
+        else:
+            self.FILE, self.RANK = FILE, RANK
+            self.square_names = _SQ_NAMES  # Indexed by file*8 + rank.
         
         self.files = numFiles
         self.ranks = numRanks
-        self.pieces = []  # For iterating through pieces on the board.
+        # Indexed by 6*piece.color_id + piece.type_id.
+        self.bb = np.zeros(12, dtype=np.uint64)
+        # Indexed by piece.color_id.
+        self.occ_by_color = np.zeros(2, dtype=np.uint64)
+        self.occ = np.uint64(0)
+        onBoard = (_SQ_FILES < numFiles) & (_SQ_RANKS < numRanks)
+        # Squares that are on the board, for boards smaller than 8 x 8.
+        self.mask = np.bitwise_or.reduce(_SQUARE_BIT_ARRAY[onBoard])
+        self.piece_idx = np.full(64, -1, dtype=np.int8)
+        self.zobrist = np.uint64(0)
+        self.pieces = set()  # For iterating through pieces on the board.
             # Will be populated when pieces are added.
-        self.queens, self.rooks, self.knights, self.bishops = (
-            {'white': [], 'black': []}, {'white': [], 'black': []},
-            {'white': [], 'black': []}, {'white': [], 'black': []},
-        )  # For iterating to find if multiple pieces of the same type and 
-           # color are on the same file or rank.
-        self.piece_lists = dict(
-            Queen = self.queens,
-            Rook = self.rooks,
-            Knight = self.knights,
-            Bishop = self.bishops,
-        )
+        # For iterating to find if multiple pieces of the same type and
+        # color are on the same file or rank.  Indexed as
+        # piece_lists[piece.type_id][piece.color_id].
+        self.piece_lists = [[set(), set()] for _ in range(4)]
+        self.queens = self.piece_lists[PIECE_QUEEN]
+        self.rooks = self.piece_lists[PIECE_ROOK]
+        self.knights = self.piece_lists[PIECE_KNIGHT]
+        self.bishops = self.piece_lists[PIECE_BISHOP]
         
-        emptyBoard = []
-        # for _ in range(numFiles):
-        #     emptyBoard.append([])
-        for file in range(numFiles):
-            for rank in range(numRanks):
-                emptyBoard.append(Square(file, rank, self))
-        self.squares = np.array(
-            emptyBoard, dtype=Square
-            ).reshape((self.files, self.ranks))
+        # Flat list indexed by file*8 + rank.  Squares past the edge of
+        # a board smaller than 8 x 8 are None.
+        self.squares = [
+            Square(sq >> 3, sq & 7, self) if isOnBoard else None
+            for sq, isOnBoard in enumerate(onBoard.tolist())
+        ]
         # Make attributes for each of the kings. Will be set when the board is 
         # generated. Will be used for checks and pins.
         self.white_king = None
         self.black_king = None
     
+    def sq(self, file: int, rank: int) -> Square:
+        """
+        Returns the Square at the given file and rank.
+        
+        Raises IndexError if the file or rank is off the board.
+        """
+        if not (0 <= file < self.files and 0 <= rank < self.ranks):
+            raise IndexError(
+                f'Square ({file}, {rank}) is off the '
+                f'{self.files} x {self.ranks} board.')
+        
+        return self.squares[file*8 + rank]
+    
     def get_size(self) -> Tuple[int]:
         """
         Gives the dimensions of the board.
@@ -261,51 +431,102 @@ class Board():
         """
         return self.files, self.ranks
     
-    def update_pieces(self, /, pieces_set: list=[],
-                      pieces_removed: list=[]) -> None:
+    def line_attacks(self, sq: int, direction: Tuple[int]) -> int:
+        """
+        Returns a bitboard of the squares a slider on sq attacks along
+        the line of the given direction (in both senses), up to and
+        including the first piece it runs into.
+        """
+        masks, attacks = LINE_ATTACKS[direction]
+        return attacks[sq, int(self.occ) & masks[sq]]
+    
+    def update_pieces(self, /, pieces_set: Union[list, None]=None,
+                      pieces_removed: Union[list, None]=None) -> None:
         """
         Updates the Board's pieces attribute by removing captured
         pieces and adding new ones (e.g., from Pawn promotion).
         """
+        if pieces_set is None and pieces_removed is None and self.pieces:
+            return  # Nothing to add or remove.
+        
         if not self.pieces:
-            # If the board hasn't had its pieces attribute set, iterate through
-            # all of the squares and add the pieces to their relevant lists.
-            for square in self.squares.flat:
-                if square.has_piece():
-                    piece = square.get_piece()
-                    name = piece.get_name()
-                    color = piece.get_color()
-                    self.pieces.append(piece)
-                    if name in self.piece_lists.keys():
-                        self.piece_lists[name][color].append(piece)
+            # If the board hasn't had its pieces attribute set, find the
+            # occupied squares and add the pieces to their relevant lists.
+            for sq in np.flatnonzero(self.piece_idx >= 0):
+                piece = self.squares[sq].get_piece()
+                self.pieces.add(piece)
+                if piece.type_id < PIECE_KING:  # Queen, Rook, Knight, Bishop
+                    self.piece_lists[piece.type_id][piece.color_id].add(piece)
         
         else:
             # If pieces are removed or added to the board, 
             # remove/add them to their relevant lists.
             if pieces_set:
-                for piece in reversed(pieces_set):
-                    name = piece.get_name()
-                    color = piece.get_color()
-                    self.pieces.append(piece)
-                    if name in self.piece_lists.keys():
-                        self.piece_lists[name][color].append(piece)
-                        self.piece_lists[name][color] = list(set(
-                            self.piece_lists[name][color]))
+                for piece in pieces_set:
+                    self.pieces.add(piece)
+                    if piece.type_id < PIECE_KING:
+                        pieceList = self.piece_lists[piece.type_id]
+                        pieceList[piece.color_id].add(piece)
             if pieces_removed:
-                for piece in reversed(pieces_removed):
-                    name = piece.get_name()
-                    color = piece.get_color()
-                    self.pieces.remove(piece)
-                    if name in self.piece_lists.keys():
-                        self.piece_lists[name][color].remove(piece)
-                        self.piece_lists[name][color] = list(set(
-                            self.piece_lists[name][color]))
-        
-        self.pieces = list(set(self.pieces))
+                for piece in pieces_removed:
+                    self.pieces.discard(piece)
+                    if piece.type_id < PIECE_KING:
+                        pieceList = self.piece_lists[piece.type_id]
+                        pieceList[piece.color_id].discard(piece)
     
     def get_pieces(self) -> list:
         """Returns a list of pieces currently on the board."""
-        return self.pieces
+        return list(self.pieces)
+
+
+# Board setups, given as (piece class, color, file, rank) for each piece.
+_KINGS = ((King, 'white', 4, 7), (King, 'black', 4, 0))
+STANDARD_SPEC = (
+    tuple((Pawn, 'white', file, 6) for file in range(8))
+    + tuple((Pawn, 'black', file, 1) for file in range(8))
+    + tuple((Rook, color, file, rank) for file in (0, 7)
+            for color, rank in (('white', 7), ('black', 0)))
+    + tuple((Knight, color, file, rank) for file in (1, 6)
+            for color, rank in (('white', 7), ('black', 0)))
+    + tuple((Bishop, color, file, rank) for file in (2, 5)
+            for color, rank in (('white', 7), ('black', 0)))
+    + ((Queen, 'white', 3, 7), (Queen, 'black', 3, 0))
+    + _KINGS
+)
+# Endgame setups, keyed by the first letter of the stronger side's color.
+TWO_ROOKS_SPECS = {
+    color[0]: tuple((Rook, color, file, rank) for file in (0, 7)) + _KINGS
+    for color, rank in (('white', 7), ('black', 0))
+}
+QUEEN_SPECS = {
+    color[0]: tuple((Queen, color, file, rank) for file in (0, 7)) + _KINGS
+    for color, rank in (('white', 7), ('black', 0))
+}
+
+
+def buildBoard(spec: Tuple[tuple]):
+    """
+    Sets up a chess board from a spec of
+    
+        (piece class, color, file, rank)
+    
+    tuples, one for each piece.
+    
+    Returns a Board object populated with pieces.
+    """
+    board = Board()
+    for pieceClass, color, file, rank in spec:
+        piece = pieceClass(color)
+        board.sq(file, rank).set_piece(piece)
+        if pieceClass is King:
+            if color == 'white':
+                board.white_king = piece
+            else:
+                board.black_king = piece
+    
+    board.update_pieces()
+    
+    return board
 
 
 def makeStandardBoard():
@@ -314,35 +535,7 @@ def makeStandardBoard():
 
     Returns a Board object populated with pieces.
     """
-    board = Board()  # Create an empty chessboard.
-    # First, set the pawns.
-    for file in range(8):
-        board.squares[file, 6].set_piece(Pawn('white'))
-        board.squares[file, 1].set_piece(Pawn('black'))
-    # Set the Rooks.
-    for file in (0, 7):
-        board.squares[file, 7].set_piece(Rook('white'))
-        board.squares[file, 0].set_piece(Rook('black'))
-    # Set the Knights.
-    for file in (1, 6):
-        board.squares[file, 7].set_piece(Knight('white'))
-        board.squares[file, 0].set_piece(Knight('black'))
-    # Set the Bishops.
-    for file in (2, 5):
-        board.squares[file, 7].set_piece(Bishop('white'))
-        board.squares[file, 0].set_piece(Bishop('black'))
-    # Set the Queens.
-    board.squares[3, 7].set_piece(Queen('white'))
-    board.squares[3, 0].set_piece(Queen('black'))
-    # Finally, set the Kings.
-    board.white_king = King('white')
-    board.squares[4, 7].set_piece(board.white_king)
-    board.black_king = King('black')
-    board.squares[4, 0].set_piece(board.black_king)
-
-    board.update_pieces()
-
-    return board
+    return buildBoard(STANDARD_SPEC)
 
 
 def makeTwoRooksEndgameBoard(rookColor: str):
@@ -353,58 +546,25 @@ def makeTwoRooksEndgameBoard(rookColor: str):
     rookColor is either 'white' or 'black', depending on which king you
     want the rooks to be allied with.
     """
-    board = Board()
-    if rookColor.lower().startswith('w'):
-        rookColor = 'white'
-        rank = 7
-    elif rookColor.lower().startswith('b'):
-        rookColor = 'black'
-        rank = 0
-    else:
+    spec = TWO_ROOKS_SPECS.get(rookColor[:1].lower())
+    if spec is None:
         print("rookColor must be either 'black' or 'white'.")
         return None
     
-    # Set the Rooks.
-    for file in (0, 7):
-        board.squares[file, rank].set_piece(Rook(rookColor))
-    # Set the Kings.
-    board.white_king = King('white')
-    board.squares[4, 7].set_piece(board.white_king)
-    board.black_king = King('black')
-    board.squares[4, 0].set_piece(board.black_king)
-    
-    board.update_pieces()
-    
-    return board
+    return buildBoard(spec)
+
 
 def makeQueenEndgameBoard(queenColor: str):
     """
-    Sets up a chess board with two rooks and a king versus the other
+    Sets up a chess board with two queens and a king versus the other
     king.
     
-    rookColor is either 'white' or 'black', depending on which king you
-    want the rooks to be allied with.
+    queenColor is either 'white' or 'black', depending on which king you
+    want the queens to be allied with.
     """
-    board = Board()
-    if queenColor.lower().startswith('w'):
-        queenColor = 'white'
-        rank = 7
-    elif queenColor.lower().startswith('b'):
-        queenColor = 'black'
-        rank = 0
-    else:
+    spec = QUEEN_SPECS.get(queenColor[:1].lower())
+    if spec is None:
         print("queenColor must be either 'black' or 'white'.")
         return None
     
-    # Set the Queen.
-    for file in (0, 7):
-        board.squares[file, rank].set_piece(Queen(queenColor))
-    # Set the Kings.
-    board.white_king = King('white')
-    board.squares[4, 7].set_piece(board.white_king)
-    board.black_king = King('black')
-    board.squares[4, 0].set_piece(board.black_king)
-    
-    board.update_pieces()
-    
-    return board
\ No newline at end of file
+    return buildBoard(spec)
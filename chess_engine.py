@@ -173,7 +173,7 @@ class GameState():
 #                     check[0].get_piece().get_fullname()
 #                 ))
 # =============================================================================
-        s = self.board.squares
+        s = self.board.sq
         kingFile, kingRank = king.get_coords()
         if self.checks:
             self.in_check = True
@@ -196,7 +196,7 @@ class GameState():
                             kingRank + checkDirection[1]*y)
                         if (0 <= endFile < self.file_size
                                 and 0 <= endRank < self.rank_size):
-                            validSquare = s[(endFile, endRank)]
+                            validSquare = s(endFile, endRank)
                             validSquares.append(validSquare)
                             if validSquare == checkSquare:
                                 break
@@ -246,7 +246,7 @@ class GameState():
 
     def get_castle_moves(self, king, moves):
         """Adds castling moves to valid moves."""
-        s = self.board.squares
+        s = self.board.sq
         kingFile, kingRank = king.get_coords()
         kingSquare = king.get_square()
         for move in moves:
@@ -254,12 +254,12 @@ class GameState():
                 # Look to the left and right of the King for potential
                 # castling squares.
                 for x, _ in DIRECTIONS['HORIZONTAL']:
-                    rookSquare = s[kingFile + x, kingRank]
+                    rookSquare = s(kingFile + x, kingRank)
                     # If the king can't move to the first square to the
                     # side, he can't castle, move on to the next direction.
                     if rookSquare == move.end_square:
                         castleFile = kingFile + x * 2
-                        castleSquare = s[castleFile, kingRank]
+                        castleSquare = s(castleFile, kingRank)
                         # Make sure the square is unoccupied.
                         if not castleSquare.has_piece():
                             # Make sure path to rook is empty.
@@ -267,7 +267,7 @@ class GameState():
                                 newFile = kingFile + x * i
                                 # Check if the square is on the board.
                                 if 0 <= newFile < self.file_size:
-                                    pathSquare = s[newFile, kingRank]
+                                    pathSquare = s(newFile, kingRank)
                                     if pathSquare.has_piece():
                                         piece = pathSquare.get_piece()
                                         if (pathSquare.has_enemy_piece(king)
@@ -329,25 +329,25 @@ class GameState():
         unless obstructed by a piece, and diagonal capture.
         """
         board = self.board
-        s = board.squares
+        s = board.sq
         f, r = pawn.get_coords()
-        startSquare = s[f, r]
+        startSquare = s(f, r)
         y = pawn.get_directions()[1]
 
         # Vertical moves
         if (not pawn.is_pinned()
             or pawn.get_pin_direction() == (0, y)
             or pawn.get_pin_direction() == (0, -y)):
-            if (r + y < self.rank_size
-                and not s[f, r + y].has_piece()):
-                moves.append(Move(startSquare, s[f, r + y],
+            if (0 <= r + y < self.rank_size
+                and not s(f, r + y).has_piece()):
+                moves.append(Move(startSquare, s(f, r + y),
                         self.move_number))
                 # Double move on first turn.
                 if (
                     (not pawn.has_moved())
-                    and not s[f, r + 2*y].has_piece()
+                    and not s(f, r + 2*y).has_piece()
                 ):
-                    moves.append(Move(startSquare, s[f, r + 2*y],
+                    moves.append(Move(startSquare, s(f, r + 2*y),
                         self.move_number))
 
         # Captures
@@ -356,7 +356,7 @@ class GameState():
                 or pawn.get_pin_direction() == (x, y)):
                 if ((0 <= f+x < self.file_size)
                     and (0 <= r+y < self.rank_size)):
-                    captureSquare = s[f+x, r+y]
+                    captureSquare = s(f+x, r+y)
                     if (captureSquare.has_piece()
                         and captureSquare.has_enemy_piece(pawn)):
                         moves.append(Move(startSquare, captureSquare,
@@ -366,8 +366,8 @@ class GameState():
         if (self.enpassant_coords != ()
                 and abs(f - self.enpassant_coords[0]) == 1
                 and r == self.enpassant_coords[1]):
-            epSquare = s[self.enpassant_coords]
-            endSquare = s[self.enpassant_coords[0], r+y]
+            epSquare = s(*self.enpassant_coords)
+            endSquare = s(self.enpassant_coords[0], r+y)
             move = Move(
                 startSquare, endSquare, self.move_number,
                 enpassantSquare=epSquare
@@ -391,19 +391,19 @@ class GameState():
         if piece.is_on_board():  # Possible fix to AI bug.
             if not piece.is_pinned():
                 f, r = piece.get_coords()
-                s = self.board.squares
+                s = self.board.sq
                 for x, y in piece.get_directions():
                     endFile, endRank = f+x, r+y
                     if (
                         (0 <= endFile < self.file_size)
                         and (0 <= endRank < self.rank_size)
                     ):
-                        if not s[endFile, endRank].has_friendly_piece(piece):
-                            if piece.get_coords() != s[f, r].get_coords():
+                        if not s(endFile, endRank).has_friendly_piece(piece):
+                            if piece.get_coords() != s(f, r).get_coords():
                                 print(f'Piece square: {piece.get_coords()}')
-                                print(f'Move square: {s[f, r].get_coords()}')
+                                print(f'Move square: {s(f, r).get_coords()}')
                             moves.append(
-                                Move(s[f, r], s[endFile, endRank],
+                                Move(s(f, r), s(endFile, endRank),
                                      self.move_number)
                             )
 
@@ -411,38 +411,31 @@ class GameState():
         """
         Finds all squares along a horizontal, vertical, or diagonal
         path and adds them to the move list.
+
+        The paths are looked up from the board's bitboards, so each
+        line the piece moves along costs a single table lookup.
         """
         if piece.is_on_board():
+            board = self.board
             start_square = piece.get_square()
-            f, r = start_square.get_coords()
-            if self.file_size >= self.rank_size:
-                pathRange = self.file_size
-            else:
-                pathRange = self.rank_size
+            sq = start_square.sq
+            targets = 0
             for direction in piece.get_directions():
                 x, y = direction
                 if (not piece.is_pinned()
                     or piece.get_pin_direction() == direction
                     or piece.get_pin_direction() == (-x, -y)):
-                    for i in range(1, pathRange):
-                        file, rank = f + x*i, r + y*i
-                        if (0 <= file < self.file_size
-                            and 0 <= rank < self.rank_size):
-                            path_square = self.board.squares[file, rank]
-                            if path_square.has_piece():
-                                if path_square.has_friendly_piece(piece):
-                                    break
-                                elif path_square.has_enemy_piece(piece):
-                                    moves.append(Move(
-                                        start_square, path_square,
-                                        self.move_number
-                                        ))
-                                    break
-                            else:
-                                moves.append(
-                                    Move(start_square, path_square,
-                                         self.move_number)
-                                )
+                    targets |= board.line_attacks(sq, direction)
+            friendly = board.occ_by_color[piece.color_id]
+            targets &= int(board.mask & ~friendly)
+            while targets:
+                bit = targets & -targets
+                end = bit.bit_length() - 1
+                moves.append(Move(
+                    start_square, board.squares[end],
+                    self.move_number
+                ))
+                targets ^= bit
 
     def get_pins_and_checks(self, king, king_end_square=None):
         """Finds all pinned pieces and checks."""
@@ -466,7 +459,7 @@ class GameState():
                 (endFile, endRank) = (kingFile + x*i, kingRank + y*j)
                 if ((0 <= endFile < self.file_size)
                     and (0 <= endRank < self.rank_size)):
-                    square = self.board.squares[endFile, endRank]
+                    square = self.board.sq(endFile, endRank)
                     if square.has_friendly_piece(king):
                         # First ally piece could be pinned.
                         piece = square.get_piece()
@@ -526,7 +519,7 @@ class GameState():
                 (0 <= endFile < self.file_size)
                 and (0 <= endRank < self.rank_size)
             ):
-                square = self.board.squares[endFile, endRank]
+                square = self.board.sq(endFile, endRank)
                 if (
                     square.has_enemy_piece(king)
                     and square.get_piece().get_name() == 'Knight'
@@ -655,8 +648,8 @@ class Move():
                 symbol = piece_moved.get_symbol()
                 startSquareName = ''
                 if name != 'King':
-                    color = piece_moved.get_color()
-                    pieceList = gs.board.piece_lists[name][color]
+                    pieceList = gs.board.piece_lists[piece_moved.type_id][
+                        piece_moved.color_id]
                     if len(pieceList) > 1:
                         file, rank = '', ''
                         for piece in pieceList:
@@ -4,6 +4,7 @@ import sys
 import pygame as p
 
 import chess_engine
+from chess_board import LIGHT, DARK
 import chess_ai as ai
 from chess_themes import themes
 from chess_menu import mainMenu
@@ -32,7 +33,6 @@ def main():
     theme = themes[theme_name]
     gs = chess_engine.GameState()
     board = gs.board
-    squares = board.squares
     gs.valid_moves = gs.get_valid_moves()
     validMoves = gs.valid_moves
     moveMade = False  # Flag variable for when a move is made. Prevents engine
@@ -68,7 +68,7 @@ def main():
                         file, rank = FLIPPEDBOARD[file], FLIPPEDBOARD[rank]
                     if squareClicked == (file, rank):  # User clicked the same
                         # square twice.
-                        deselectSquare(squares[file, rank])
+                        deselectSquare(board.sq(file, rank))
                         squareClicked = ()
                         playerClicks = []  # Clear player clicks.
                     else:
@@ -78,8 +78,8 @@ def main():
 
                     # Stops move if first click is a blank square.
                     if len(playerClicks) == 1:
-                        if squares[playerClicks[0]].has_piece():
-                            selectSquare(squares[playerClicks[0]])
+                        if board.sq(*playerClicks[0]).has_piece():
+                            selectSquare(board.sq(*playerClicks[0]))
                         else:
                             squareClicked = ()
                             playerClicks = []
@@ -87,10 +87,10 @@ def main():
                     if len(playerClicks) == 2:  # After second click.
                         # Only register a move if the first
                         # square clicked has a piece.
-                        if squares[playerClicks[0]].has_piece():
+                        if board.sq(*playerClicks[0]).has_piece():
                             move = chess_engine.Move(
-                                squares[playerClicks[0]],
-                                squares[playerClicks[1]],
+                                board.sq(*playerClicks[0]),
+                                board.sq(*playerClicks[1]),
                                 gs.move_number
                             )
                             for validMove in validMoves:
@@ -106,9 +106,9 @@ def main():
                                     break
 
                             if not moveMade:
-                                deselectSquare(squares[playerClicks[0]])
-                                if squares[playerClicks[1]].has_piece():
-                                    selectSquare(squares[playerClicks[1]])
+                                deselectSquare(board.sq(*playerClicks[0]))
+                                if board.sq(*playerClicks[1]).has_piece():
+                                    selectSquare(board.sq(*playerClicks[1]))
                                     playerClicks = [playerClicks[1]]
 
                                 else:
@@ -157,7 +157,7 @@ def main():
             gs.valid_moves = gs.get_valid_moves()
             validMoves = gs.valid_moves
             if playerClicks:
-                deselectSquare(squares[playerClicks[0]])
+                deselectSquare(board.sq(*playerClicks[0]))
             squareClicked = ()
             playerClicks = []
             moveMade = False
@@ -224,8 +224,9 @@ def drawBoard(validMoves):
     """
     global selectedSquare
     selectedSquare = None
-    squares = gs.board.squares.T.flat
-    for square in squares:
+    for square in gs.board.squares:
+        if square is None:  # Off the edge of a small board.
+            continue
         file, rank = getSquareCoordinates(square)
         if square.is_selected():
             selectedSquare = square
@@ -253,11 +254,11 @@ def highlightLastMove():
         endFile, endRank = getSquareCoordinates(endSquare)
         # Draw square highlights for start and end squares.
         startSquareColor = (
-            p.Color(theme[4]) if startSquare.get_color() == 'light'
+            p.Color(theme[4]) if startSquare.get_color() is LIGHT
             else p.Color(theme[5])
         )
         endSquareColor = (
-            p.Color(theme[4]) if endSquare.get_color() == 'light'
+            p.Color(theme[4]) if endSquare.get_color() is LIGHT
             else p.Color(theme[5])
         )
         startSurface = p.Surface((SQ_SIZE, SQ_SIZE))
@@ -455,9 +456,9 @@ def getSquareThemeColor(square):
     Returns the square color for the given square on the chessboard
     to be rendered on screen.
     """
-    if square.get_color() == 'light':
+    if square.get_color() is LIGHT:
         return theme[0]
-    elif square.get_color() == 'dark':
+    elif square.get_color() is DARK:
         return theme[1]
 
 
@@ -466,9 +467,9 @@ def getSquareThemeHighlightColor(square):
     Returns the highlighted square color for the given square on the
     chessboard to be rendered on screen.
     """
-    if square.get_color() == 'light':
+    if square.get_color() is LIGHT:
         return theme[2]
-    elif square.get_color() == 'dark':
+    elif square.get_color() is DARK:
         return theme[3]
 
 
@@ -7,6 +7,12 @@ if TYPE_CHECKING:
     from chess_board import Square
     from chess_engine import Move
 
+# Integer codes for the piece types and colors, used to index the
+# Board's piece lists and bitboards without hashing strings.
+PIECE_QUEEN, PIECE_ROOK, PIECE_KNIGHT, PIECE_BISHOP, PIECE_KING, PIECE_PAWN = (
+    range(6))
+COLOR_W, COLOR_B = 0, 1
+
 DIRECTIONS = dict(
     DIAGONAL = (
         (1, -1),   # Up Left
@@ -49,13 +55,15 @@ class Piece:
         Args:
             color - 'white' or 'black'
         """
-        # Piece.name and Piece.symbol are set in subclasses. Methods
-        # using Piece.name and Piece.symbol should not raise errors as
+        # Piece.name, Piece.symbol and Piece.type_id are set in subclasses.
+        # Methods using Piece.name and Piece.symbol should not raise errors as
         # long as objects are created only through Piece's subclasses.
         if color.lower().startswith('w'):
             self.color = 'white'
+            self.color_id = COLOR_W
         elif color.lower().startswith('b'):
             self.color = 'black'
+            self.color_id = COLOR_B
         else:
             raise ValueError("The Piece's color must be 'white' or 'black'.")
         self.square = None   # Square will be set later, start with None.
@@ -141,8 +149,7 @@ class Piece:
         Assigns a Square object to the Piece and then assigns the Piece
         to that same Square object.
         """
-        self.square = square
-        square.piece = self
+        square.set_piece(self)
     
     def is_on_board(self) -> bool:
         """
@@ -254,6 +261,7 @@ class Rook(Piece):
     def __init__(self, color: str) -> None:
         self.name = 'Rook'
         self.symbol = 'R'
+        self.type_id = PIECE_ROOK
         
         super().__init__(color)
         
@@ -270,6 +278,7 @@ class King(Piece):
     def __init__(self, color: str) -> None:
         self.name = 'King'
         self.symbol = 'K'
+        self.type_id = PIECE_KING
         
         super().__init__(color)
         
@@ -291,6 +300,7 @@ class Queen(Piece):
     def __init__(self, color: str) -> None:
         self.name = 'Queen'
         self.symbol = 'Q'
+        self.type_id = PIECE_QUEEN
         
         super().__init__(color)
         
@@ -313,6 +323,7 @@ class Knight(Piece):
     def __init__(self, color: str) -> None:
         self.name = 'Knight'
         self.symbol = 'N'
+        self.type_id = PIECE_KNIGHT
         
         super().__init__(color)
         
@@ -329,6 +340,7 @@ class Bishop(Piece):
     def __init__(self, color: str) -> None:
         self.name = 'Bishop'
         self.symbol = 'B'
+        self.type_id = PIECE_BISHOP
         
         super().__init__(color)
         
@@ -346,6 +358,7 @@ class Pawn(Piece):
     def __init__(self, color: str) -> None:
         self.name = 'Pawn'
         self.symbol = 'P'
+        self.type_id = PIECE_PAWN
         
         super().__init__(color)
         